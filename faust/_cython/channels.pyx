@@ -0,0 +1,57 @@
+# cython: language_level=3
+from faust.exceptions import KeyDecodeError, ValueDecodeError
+
+
+cdef class Decoder:
+
+    cdef public:
+        object app
+        object loads_key
+        object loads_value
+        object create_event
+        object schema_loads_key
+        object schema_loads_value
+        object on_key_decode_error
+        object on_value_decode_error
+        bint allow_empty
+        bint default_propagate
+
+    def __init__(self,
+                 object app,
+                 object schema,
+                 object on_key_decode_error,
+                 object on_value_decode_error,
+                 bint default_propagate):
+        self.app = app
+        self.loads_key = app.serializers.loads_key
+        self.loads_value = app.serializers.loads_value
+        self.create_event = app.create_event
+        self.schema_loads_key = schema.loads_key
+        self.schema_loads_value = schema.loads_value
+        self.on_key_decode_error = on_key_decode_error
+        self.on_value_decode_error = on_value_decode_error
+        self.allow_empty = bool(schema.allow_empty)
+        self.default_propagate = default_propagate
+
+    async def __call__(self, object message, *, object propagate=None):
+        cdef:
+            object k
+            object v
+        if propagate is None:
+            propagate = self.default_propagate
+        try:
+            k = self.schema_loads_key(self.app, message, loads=self.loads_key)
+            if message.value is None and self.allow_empty:
+                return self.create_event(k, None, message.headers, message)
+            v = self.schema_loads_value(
+                self.app, message, loads=self.loads_value)
+        except KeyDecodeError as exc:
+            if propagate:
+                raise
+            await self.on_key_decode_error(exc, message)
+        except ValueDecodeError as exc:
+            if propagate:
+                raise
+            await self.on_value_decode_error(exc, message)
+        else:
+            return self.create_event(k, v, message.headers, message)
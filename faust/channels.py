@@ -10,7 +10,6 @@ import asyncio
 from typing import (
     Any,
     Awaitable,
-    Callable,
     Mapping,
     MutableSet,
     Optional,
@@ -53,6 +52,9 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 T_contra = TypeVar("T_contra", contravariant=True)
 
+#: Topic partition reported for messages published to anonymous channels.
+_ANON_TP = TP("<anon>", -1)
+
 
 class Channel(ChannelT[T]):
     """Create new channel.
@@ -68,6 +70,10 @@ class Channel(ChannelT[T]):
         maxsize: The maximum number of messages this channel can hold.
                  If exceeded any new ``put`` call will block until a message
                  is removed from the channel.
+        queue: The queue backing this channel.  Must be managed
+           by ``app.flow_control`` (e.g. created using
+           ``app.FlowControlQueue``), as puts only wait for the flow
+           control of the app.
         is_iterator: When streams iterate over a channel they will call
             ``stream.clone(is_iterator=True)`` so this attribute
             denotes that this channel instance is currently being iterated
@@ -106,7 +112,6 @@ class Channel(ChannelT[T]):
         self.is_iterator = is_iterator
         self._queue = queue
         self.maxsize = maxsize
-        self.deliver = self._compile_deliver()  # type: ignore
         self._root = cast(Channel, root)
         self.active_partitions = active_partitions
         self._subscribers = WeakSet()
@@ -342,17 +347,21 @@ class Channel(ChannelT[T]):
         """
         event = self._future_message_to_event(fut)
         await self.put(event)
-        topic, partition = tp = TP(
-            fut.message.topic or "<anon>", fut.message.partition or -1
-        )
+        message = fut.message
+        if not message.topic and not message.partition:
+            # in-memory channels have no topic/partition, so we can
+            # reuse the same TP for every message.
+            tp = _ANON_TP
+        else:
+            tp = TP(message.topic or "<anon>", message.partition or -1)
         return await self._finalize_message(
             fut,
             RecordMetadata(
-                topic=topic,
-                partition=partition,
+                topic=tp.topic,
+                partition=tp.partition,
                 topic_partition=tp,
                 offset=-1,
-                timestamp=fut.message.timestamp,
+                timestamp=message.timestamp,
                 timestamp_type=1,
             ),
         )
@@ -420,26 +429,18 @@ class Channel(ChannelT[T]):
             message.key, message.value, message.headers, message=message
         )
 
-    async def deliver(self, message: Message) -> None:  # pragma: no cover
+    async def deliver(self, message: Message) -> None:
         """Deliver message to queue from consumer.
 
         This is called by the consumer to deliver the message
         to the channel.
         """
-        ...  # closure compiled at __init__
-
-    def _compile_deliver(self) -> Callable[[Message], Awaitable[None]]:
-        put = None
-
-        async def deliver(message: Message) -> None:
-            nonlocal put
-            if put is None:
-                # NOTE circumvents self.put, using queue directly
-                put = self.queue.put
-            event = await self.decode(message)
-            await put(event)
-
-        return deliver
+        event = await self.decode(message)
+        # NOTE circumvents self.put, using queue directly
+        queue = self._queue
+        if queue is None:
+            queue = self.queue
+        await self._put_queue(queue, event)
 
     def _create_event(
         self, key: K, value: V, headers: Optional[HeadersArg], message: Message
@@ -450,14 +451,33 @@ class Channel(ChannelT[T]):
         """Put event onto this channel."""
         root = self._root if self._root is not None else self
         for subscriber in root._subscribers:
-            await subscriber.queue.put(value)
+            queue = subscriber._queue
+            if queue is None:
+                queue = subscriber.queue
+            await self._put_queue(queue, value)
+
+    async def _put_queue(self, queue: ThrowableQueue, value: EventT) -> None:
+        # Queue.put only suspends while flow control is paused or the
+        # queue is full, so when neither is the case we skip the
+        # put coroutine and hand the event over synchronously.
+        # Flow control is checked for every put, as it may be suspended
+        # while we wait for a full queue.
+        # NOTE: This checks app.flow_control, which is what manages
+        # queues created by app.FlowControlQueue.
+        if self.app.flow_control.is_active() and not queue.full():
+            queue.put_nowait(value)
+        else:
+            await queue.put(value)
 
     async def get(self, *, timeout: Optional[Seconds] = None) -> EventT[T]:
         """Get the next :class:`~faust.Event` received on this channel."""
         timeout_: float = want_seconds(timeout)
+        queue = self._queue
+        if queue is None:
+            queue = self.queue
         if timeout_:
-            return await asyncio.wait_for(self.queue.get(), timeout=timeout_)
-        return await self.queue.get()
+            return await asyncio.wait_for(queue.get(), timeout=timeout_)
+        return await queue.get()
 
     def empty(self) -> bool:
         """Return :const:`True` if the queue is empty."""
@@ -527,7 +547,10 @@ class Channel(ChannelT[T]):
     async def __anext__(self) -> EventT[T]:
         if not self.is_iterator:
             raise RuntimeError("Need to call channel.__aiter__()")
-        return await self.queue.get()
+        queue = self._queue
+        if queue is None:
+            queue = self.queue
+        return await queue.get()
 
     async def throw(self, exc: BaseException) -> None:
         """Throw exception to be received by channel subscribers.
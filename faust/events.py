@@ -2,7 +2,7 @@
 
 import typing
 from types import TracebackType
-from typing import Any, Awaitable, Optional, Type, Union, cast
+from typing import Any, Awaitable, Optional, Type, Union
 
 from faust.types import (
     AppT,
@@ -144,19 +144,13 @@ class Event(EventT):
         force: bool = False,
     ) -> Awaitable[RecordMetadata]:
         """Send object to channel."""
-        if key is USE_EXISTING_KEY:
-            key = self.key
-        if value is USE_EXISTING_VALUE:
-            value = self.value
-        if headers is USE_EXISTING_HEADERS:
-            headers = self.headers
         return await self._send(
             channel,
-            key,
-            value,
+            self.key if key is USE_EXISTING_KEY else key,
+            self.value if value is USE_EXISTING_VALUE else value,
             partition,
             timestamp,
-            headers,
+            self.headers if headers is USE_EXISTING_HEADERS else headers,
             schema,
             key_serializer,
             value_serializer,
@@ -179,21 +173,14 @@ class Event(EventT):
         force: bool = False,
     ) -> Awaitable[RecordMetadata]:
         """Forward original message (will not be reserialized)."""
-        if key is USE_EXISTING_KEY:
-            key = self.message.key
-        if value is USE_EXISTING_VALUE:
-            value = self.message.value
-        if headers is USE_EXISTING_HEADERS:
-            headers = self.message.headers
-            if not headers:
-                headers = None
+        message = self.message
         return await self._send(
             channel,
-            key,
-            value,
+            message.key if key is USE_EXISTING_KEY else key,
+            message.value if value is USE_EXISTING_VALUE else value,
             partition,
             timestamp,
-            headers,
+            (message.headers or None) if headers is USE_EXISTING_HEADERS else headers,
             schema,
             key_serializer,
             value_serializer,
@@ -215,7 +202,8 @@ class Event(EventT):
         callback: Optional[MessageSentCallback] = None,
         force: bool = False,
     ) -> Awaitable[RecordMetadata]:
-        return await cast(_App, self.app)._attachments.maybe_put(
+        app: _App = self.app  # type: ignore
+        return await app._attachments.maybe_put(
             channel,
             key,
             value,
@@ -242,7 +230,8 @@ class Event(EventT):
         value_serializer: CodecArg = None,
         callback: Optional[MessageSentCallback] = None,
     ) -> Awaitable[RecordMetadata]:
-        return cast(_App, self.app)._attachments.put(
+        app: _App = self.app  # type: ignore
+        return app._attachments.put(
             self.message,
             channel,
             key,
@@ -326,9 +326,16 @@ codecs: MutableMapping[str, CodecT] = {
 _extensions_finalized: MutableMapping[str, bool] = {}
 
 
+#: Cache of codecs composed from names like ``"json|binary"``,
+#: so that the codec chain is not rebuilt for every message.
+#: This is cleared whenever a new codec is registered.
+_composite_codecs: MutableMapping[str, CodecT] = {}
+
+
 def register(name: str, codec: CodecT) -> None:
     """Register new codec in the codec registry."""
     codecs[name] = codec
+    _composite_codecs.clear()
 
 
 def _maybe_load_extension_classes(namespace: str = "faust.codecs") -> None:
@@ -342,19 +349,26 @@ def get_codec(name_or_codec: CodecArg) -> CodecT:
     _maybe_load_extension_classes()
     if isinstance(name_or_codec, str):
         if "|" in name_or_codec:
-            nodes = name_or_codec.split("|")
-            codec = None
-            for node in nodes:
-                if codec:
-                    codec |= codecs[node]
-                else:
-                    codec = codecs.get(node, node)
-
-            return cast(Codec, codec)
+            try:
+                return _composite_codecs[name_or_codec]
+            except KeyError:
+                codec = _composite_codecs[name_or_codec] = _compose_codec(name_or_codec)
+                return codec
         return codecs[name_or_codec]
     return cast(Codec, name_or_codec)
 
 
+def _compose_codec(name: str) -> CodecT:
+    nodes = name.split("|")
+    codec = None
+    for node in nodes:
+        if codec:
+            codec |= codecs[node]
+        else:
+            codec = codecs.get(node, node)
+    return cast(Codec, codec)
+
+
 def dumps(codec: Optional[CodecArg], obj: Any) -> bytes:
     """Encode object into bytes."""
     return get_codec(codec).dumps(obj) if codec else obj
@@ -1,3 +1,4 @@
+import os
 import typing
 from contextlib import suppress
 from typing import Any, Awaitable, Callable, Optional, Tuple, cast
@@ -11,6 +12,16 @@ from faust.types.models import ModelArg
 from faust.types.serializers import KT, VT, SchemaT
 from faust.types.tuples import Message
 
+NO_CYTHON = bool(os.environ.get("NO_CYTHON", False))
+
+if not NO_CYTHON:  # pragma: no cover
+    try:
+        from faust._cython.channels import Decoder as _CDecoder
+    except ImportError:
+        _CDecoder = None
+else:  # pragma: no cover
+    _CDecoder = None
+
 __all__ = ["Schema"]
 
 if typing.TYPE_CHECKING:  # pragma: no cover
@@ -158,6 +169,14 @@ class Schema(SchemaT):
         default_propagate: bool = False,
     ) -> DecodeFunction:
         """Compile function used to decode event."""
+        if _CDecoder is not None:  # pragma: no cover
+            return _CDecoder(
+                app,
+                self,
+                on_key_decode_error,
+                on_value_decode_error,
+                default_propagate,
+            )
         allow_empty = self.allow_empty
         loads_key = app.serializers.loads_key
         loads_value = app.serializers.loads_value
@@ -171,21 +190,19 @@ class Schema(SchemaT):
         ) -> Any:
             try:
                 k: K = schema_loads_key(app, message, loads=loads_key)
+                if message.value is None and allow_empty:
+                    return create_event(k, None, message.headers, message)
+                v: V = schema_loads_value(app, message, loads=loads_value)
             except KeyDecodeError as exc:
                 if propagate:
                     raise
                 await on_key_decode_error(exc, message)
+            except ValueDecodeError as exc:
+                if propagate:
+                    raise
+                await on_value_decode_error(exc, message)
             else:
-                try:
-                    if message.value is None and allow_empty:
-                        return create_event(k, None, message.headers, message)
-                    v: V = schema_loads_value(app, message, loads=loads_value)
-                except ValueDecodeError as exc:
-                    if propagate:
-                        raise
-                    await on_value_decode_error(exc, message)
-                else:
-                    return create_event(k, v, message.headers, message)
+                return create_event(k, v, message.headers, message)
 
         return decode
 
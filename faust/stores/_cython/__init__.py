@@ -0,0 +1 @@
+"""Cython optimized table storage components."""
@@ -0,0 +1,23 @@
+# cython: language_level=3
+
+
+cpdef set apply_changelog_batch(dict data,
+                                dict key_partition,
+                                object batch,
+                                object to_key,
+                                object to_value):
+    cdef:
+        set to_delete
+        object event
+        object message
+        object key
+    to_delete = set()
+    for event in batch:
+        key = to_key(event.key)
+        message = event.message
+        # to delete keys in the table we set the raw value to None
+        if message.value is None:
+            to_delete.add(key)
+        key_partition[key] = message.partition
+        data[key] = to_value(event.value)
+    return to_delete
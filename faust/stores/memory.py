@@ -1,12 +1,23 @@
 """In-memory table storage."""
 
-from typing import Any, Callable, Iterable, MutableMapping, Optional, Set, Tuple, Union
+import os
+from typing import Any, Callable, Iterable, MutableMapping, Optional, Set, Union
 
 from faust.types import TP, EventT
 from faust.types.stores import KT, VT
 
 from . import base
 
+NO_CYTHON = bool(os.environ.get("NO_CYTHON", False))
+
+if not NO_CYTHON:  # pragma: no cover
+    try:
+        from ._cython.memory import apply_changelog_batch as _c_apply_changelog_batch
+    except ImportError:
+        _c_apply_changelog_batch = None
+else:  # pragma: no cover
+    _c_apply_changelog_batch = None
+
 
 class Store(base.Store, base.StoreT[KT, VT]):
     """Table storage using an in-memory dictionary."""
@@ -28,31 +39,36 @@ class Store(base.Store, base.StoreT[KT, VT]):
         # default store does not do serialization, so we need
         # to convert these raw json serialized keys to proper structures
         # (E.g. regenerate tuples in WindowedKeys etc).
-        to_delete: Set[Any] = set()
-        delete_key = self.data.pop
-        self.data.update(
-            self._create_batch_iterator(to_delete.add, to_key, to_value, batch)
-        )
+        data = self.data
+        key_partition = self._key_partition
+        to_delete: Set[Any]
+        # The C loop writes with PyDict_SetItem, so only use it for
+        # plain dicts (``data`` may be any MutableMapping).
+        if (
+            _c_apply_changelog_batch is not None
+            and type(data) is dict
+            and type(key_partition) is dict
+        ):  # pragma: no cover
+            to_delete = _c_apply_changelog_batch(
+                data, key_partition, batch, to_key, to_value
+            )
+        else:
+            to_delete = set()
+            mark_as_delete = to_delete.add
+            for event in batch:
+                key = to_key(event.key)
+                message = event.message
+                # to delete keys in the table we set the raw value to None
+                if message.value is None:
+                    mark_as_delete(key)
+                key_partition[key] = message.partition
+                data[key] = to_value(event.value)
+        delete_key = data.pop
         for key in to_delete:
             # If the key was assigned a value again, it will not be deleted.
-            if not self.data[key]:
+            if not data[key]:
                 delete_key(key, None)
-                self._key_partition.pop(key, None)
-
-    def _create_batch_iterator(
-        self,
-        mark_as_delete: Callable[[Any], None],
-        to_key: Callable[[Any], Any],
-        to_value: Callable[[Any], Any],
-        batch: Iterable[EventT],
-    ) -> Iterable[Tuple[Any, Any]]:
-        for event in batch:
-            key = to_key(event.key)
-            # to delete keys in the table we set the raw value to None
-            if event.message.value is None:
-                mark_as_delete(key)
-            self._key_partition[key] = event.message.partition
-            yield key, to_value(event.value)
+                key_partition.pop(key, None)
 
     async def on_recovery_completed(
         self, active_tps: Set[TP], standby_tps: Set[TP]
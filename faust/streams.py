@@ -312,6 +312,13 @@ class Stream(StreamT[T_co], Service):
                 Warning: If there's no timeout (i.e. `timeout=None`),
                 the agent is likely to stall and block buffered events for an
                 unreasonable length of time(!).
+
+        Note:
+            Buffered events are acked synchronously once the buffer has
+            been consumed, without awaiting :meth:`ack`, so an
+            override of :meth:`ack` is not called here.
+            The same applies to :meth:`take_events` and
+            :meth:`take_with_timestamp`.
         """
         buffer: List[T_co] = []
         events: List[EventT] = []
@@ -376,7 +383,7 @@ class Stream(StreamT[T_co], Service):
                     finally:
                         buffer.clear()
                         for event in events:
-                            await self.ack(event)
+                            self._ack_event(event)
                         events.clear()
                         # allow writing to buffer again
                         notify(buffer_consuming)
@@ -469,7 +476,7 @@ class Stream(StreamT[T_co], Service):
                     finally:
                         buffer.clear()
                         for event in events:
-                            await self.ack(event)
+                            self._ack_event(event)
                         events.clear()
                         # allow writing to buffer again
                         notify(buffer_consuming)
@@ -568,7 +575,7 @@ class Stream(StreamT[T_co], Service):
                     finally:
                         buffer.clear()
                         for event in events:
-                            await self.ack(event)
+                            self._ack_event(event)
                         events.clear()
                         # allow writing to buffer again
                         notify(buffer_consuming)
@@ -1263,6 +1270,11 @@ class Stream(StreamT[T_co], Service):
         Arguments:
             event: Event to ack.
         """
+        return self._ack_event(event)
+
+    def _ack_event(self, event: EventT) -> bool:
+        # Synchronous body of ack(), also used by take() & co.
+        # to ack buffered events without a coroutine per event.
         # WARNING: This function is duplicated in __aiter__
         last_stream_to_ack = event.ack()
         message = event.message
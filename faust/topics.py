@@ -170,7 +170,7 @@ class Topic(SerializedChannel, TopicT):
         force: bool = False,
     ) -> Awaitable[RecordMetadata]:
         """Send message to topic."""
-        app = cast(_App, self.app)
+        app: _App = self.app  # type: ignore
         if app._attachments.enabled and not force:
             event = current_event()
             if event is not None:
@@ -91,12 +91,11 @@ def dict_as_ansitable(
     title: Optional[str] = None,
 ) -> str:
     header = [text.title(key), text.title(value)]
-    data = cast(Iterable[List[str]], d.items())
-    data = sorted(data, key=sortkey) if sort else list(data)
-    if sort:
-        data = sorted(data, key=sortkey)
+    items = cast(Iterable[List[str]], d.items())
+    data = sorted(items, key=sortkey) if sort else list(items)
+    data.insert(0, header)
     return table(
-        [header] + list(data),
+        data,
         title=text.title(title) if title is not None else "",
         target=target,
     ).table
@@ -72,6 +72,13 @@ extensions = [
         extra_compile_args=CFLAGS,
         extra_link_args=LDFLAGS,
     ),
+    Extension(
+        "faust._cython.channels",
+        ["faust/_cython/channels" + ext],
+        libraries=LIBRARIES,
+        extra_compile_args=CFLAGS,
+        extra_link_args=LDFLAGS,
+    ),
     Extension(
         "faust._cython.streams",
         ["faust/_cython/streams" + ext],
@@ -79,6 +86,13 @@ extensions = [
         extra_compile_args=CFLAGS,
         extra_link_args=LDFLAGS,
     ),
+    Extension(
+        "faust.stores._cython.memory",
+        ["faust/stores/_cython/memory" + ext],
+        libraries=LIBRARIES,
+        extra_compile_args=CFLAGS,
+        extra_link_args=LDFLAGS,
+    ),
     Extension(
         "faust.transport._cython.conductor",
         ["faust/transport/_cython/conductor" + ext],
@@ -143,6 +143,19 @@ def test_clone(*, app):
     assert c.subscriber_count == 1
 
 
+def test_queue__maxsize(*, app):
+    assert app.channel().queue.maxsize == app.conf.stream_buffer_maxsize
+    assert app.channel(maxsize=10).queue.maxsize == 10
+
+
+def test_init__does_not_access_loop():
+    app = faust.App("test-init-loop")
+    app.channel()
+    app.topic("foo")
+    assert "flow_control" not in app.__dict__
+    assert app._loop is None
+
+
 @pytest.mark.asyncio
 async def test_send_receive(*, app):
     app.flow_control.resume()
@@ -184,6 +197,32 @@ async def test_send_receive(*, app):
     assert await anext(it1_2) == b"moo"
 
 
+@pytest.mark.asyncio
+async def test_put__flow_control_suspended(*, app):
+    channel = app.channel(maxsize=10)
+    it = aiter(channel)
+    app.flow_control.suspend()
+    assert await times_out(channel.put(b"foo"))
+    assert await channel_empty(channel)
+    app.flow_control.resume()
+    await channel.put(b"bar")
+    assert await anext(it) == b"bar"
+
+
+@pytest.mark.asyncio
+async def test_send__record_metadata(*, app):
+    app.flow_control.resume()
+    channel = app.channel()
+    it = aiter(channel)
+    fut = await channel.send(value=b"foo")
+    metadata = fut.result()
+    assert metadata.topic_partition == TP("<anon>", -1)
+    assert metadata.topic == "<anon>"
+    assert metadata.partition == -1
+    assert metadata.offset == -1
+    assert (await anext(it)).value == b"foo"
+
+
 @pytest.mark.asyncio
 async def test_on_key_decode_error(*, app):
     channel = app.channel()
@@ -239,6 +278,21 @@ async def test_deliver(*, channel, app):
     assert event.message is msg
 
 
+@pytest.mark.asyncio
+async def test_deliver__subclass_override(*, app):
+    class MyChannel(faust.Channel):
+        delivered = None
+
+        async def deliver(self, message):
+            self.delivered = message
+
+    channel = MyChannel(app)
+    msg = message(b"key", b"value")
+    await channel.deliver(msg)
+    assert channel.delivered is msg
+    assert await channel_empty(channel)
+
+
 def test_as_future_message__eager_partitioning(*, app):
     topic = app.topic("foo")
     app.producer = Mock(name="producer")
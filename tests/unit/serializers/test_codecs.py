@@ -78,6 +78,24 @@ def test_get_codec():
     assert get_codec(Codec) is Codec
 
 
+def test_get_codec__composite_is_cached():
+    codec = get_codec("json|binary")
+    assert get_codec("json|binary") is codec
+    assert codec.loads(codec.dumps({"a": 1})) == {"a": 1}
+
+
+def test_register__clears_composite_cache():
+    codec = get_codec("json|binary")
+    try:
+
+        class MyCodec(Codec): ...
+
+        register("mine", MyCodec)
+        assert get_codec("json|binary") is not codec
+    finally:
+        codecs.pop("mine")
+
+
 def test_register():
     try:
 
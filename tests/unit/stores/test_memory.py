@@ -71,6 +71,16 @@ class Test_Store:
         assert not store._key_partition
         assert not store.data
 
+    def test_apply_changelog_batch__dict_subclass(self, *, store):
+        class Data(dict):
+            def __setitem__(self, key, value):
+                super().__setitem__(key, ("wrapped", value))
+
+        store.data = Data()
+        event, to_key, to_value = self.mock_event_to_key_value()
+        store.apply_changelog_batch([event], to_key=to_key, to_value=to_value)
+        assert store.data[to_key()] == ("wrapped", to_value())
+
     @pytest.mark.asyncio
     async def test_apply_changelog_batch__different_partitions_repartition_single(
         self, *, store
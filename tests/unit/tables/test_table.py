@@ -139,6 +139,40 @@ class Test_Table:
             table.send_changelog.asssert_called_once_with(partition, "foo", None)
             assert "foo" not in table.data
 
+    def test_setitem(self, *, table):
+        with patch("faust.tables.base.current_event") as current_event:
+            event = current_event.return_value
+            partition = event.message.partition
+            table.send_changelog = Mock(name="send_changelog")
+            table._sensor_on_set = Mock(name="_sensor_on_set")
+            table["foo"] = "val"
+            table.send_changelog.assert_called_once_with(partition, "foo", "val")
+            table._sensor_on_set.assert_called_once_with(table, "foo", "val")
+            assert table.data["foo"] == "val"
+
+    def test_delitem(self, *, table):
+        with patch("faust.tables.base.current_event") as current_event:
+            event = current_event.return_value
+            partition = event.message.partition
+            table.send_changelog = Mock(name="send_changelog")
+            table._sensor_on_del = Mock(name="_sensor_on_del")
+            table.data["foo"] = 3
+            del table["foo"]
+            table.send_changelog.assert_called_once_with(
+                partition, "foo", value=None, value_serializer="raw"
+            )
+            table._sensor_on_del.assert_called_once_with(table, "foo")
+            assert "foo" not in table.data
+
+    def test_setitem_delitem__call_hooks(self, *, table):
+        table.on_key_set = Mock(name="on_key_set")
+        table.on_key_del = Mock(name="on_key_del")
+        table["foo"] = "val"
+        table.on_key_set.assert_called_once_with("foo", "val")
+        del table["foo"]
+        table.on_key_del.assert_called_once_with("foo")
+        assert "foo" not in table.data
+
     def test_as_ansitable(self, *, table):
         table.data["foo"] = "bar"
         table.data["bar"] = "baz"
@@ -225,6 +225,24 @@ class Test_Stream:
             event.message,
         )
 
+    def test__ack_event(self, *, stream):
+        event1 = Mock(name="event1")
+        event1.ack.return_value = True
+        event2 = Mock(name="event2")
+        event2.ack.return_value = False
+        stream._on_stream_event_out = Mock()
+        stream._on_message_out = Mock()
+        assert stream._ack_event(event1)
+        assert not stream._ack_event(event2)
+        event1.ack.assert_called_once_with()
+        event2.ack.assert_called_once_with()
+        assert stream._on_stream_event_out.call_count == 2
+        stream._on_message_out.assert_called_once_with(
+            event1.message.tp,
+            event1.message.offset,
+            event1.message,
+        )
+
     @pytest.mark.asyncio
     async def test__format_key__callable_raises(self, *, stream):
         keyfun = Mock(name="keyfun")
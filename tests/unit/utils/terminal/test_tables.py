@@ -114,3 +114,21 @@ def test_table__default_tty():
             i.return_value = None
             tables.table({}, tty=None, title="foo")
             g.assert_called_once_with(False)
+
+
+@pytest.mark.parametrize(
+    "sort,expected_rows",
+    [
+        (True, [["A", 1], ["B", 2], ["C", 3]]),
+        (False, [["B", 2], ["C", 3], ["A", 1]]),
+    ],
+)
+def test_dict_as_ansitable(sort, expected_rows):
+    with patch("faust.utils.terminal.tables.table") as table:
+        ret = tables.dict_as_ansitable(
+            {"B": 2, "C": 3, "A": 1}, sort=sort, target=None, title="foo"
+        )
+        rows = table.call_args[0][0]
+        assert rows[0] == ["Key", "Value"]
+        assert [list(row) for row in rows[1:]] == expected_rows
+        assert ret is table().table